@@ -1,60 +1,338 @@
-import json
-import os
-from typing import Optional
-from models import DashboardConfig, PageConfig
-
-
-class ConfigManager:
-    def __init__(self, config_file: str = "dashboard_config.json"):
-        self.config_file = config_file
-        self._config: Optional[DashboardConfig] = None
-
-    def load_config(self) -> DashboardConfig:
-        """Load configuration from file or create default"""
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                self._config = DashboardConfig(**data)
-            except (json.JSONDecodeError, ValueError) as e:
-                print(f"Error loading config: {e}. Using default config.")
-                self._config = self._get_default_config()
-        else:
-            self._config = self._get_default_config()
-
-        return self._config
-
-    def save_config(self, config: DashboardConfig) -> None:
-        """Save configuration to file"""
-        with open(self.config_file, 'w') as f:
-            json.dump(config.dict(), f, indent=2)
-        self._config = config
-
-    def get_config(self) -> DashboardConfig:
-        """Get current configuration"""
-        if self._config is None:
-            return self.load_config()
-        return self._config
-
-    def _get_default_config(self) -> DashboardConfig:
-        """Get default configuration"""
-        return DashboardConfig(
-            pages=[
-                PageConfig(
-                    url="https://www.google.com",
-                    duration_seconds=30,
-                    name="Google"
-                ),
-                PageConfig(
-                    url="https://www.github.com",
-                    duration_seconds=45,
-                    name="GitHub"
-                )
-            ],
-            loop=True,
-            auto_start=False
-        )
-
-
-# Global config manager instance
-config_manager = ConfigManager()
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from models import DashboardConfig, PageConfig
+
+DEFAULT_PLAYLIST = "default"
+
+
+class PlaylistNotFoundError(LookupError):
+    """Raised when a named playlist or revision does not exist"""
+
+
+class SQLiteConfigStore:
+    """Playlists, pages and revisions in a local SQLite database (WAL mode)"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS playlists (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            settings TEXT NOT NULL,
+            is_active INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS pages (
+            id INTEGER PRIMARY KEY,
+            playlist_id INTEGER NOT NULL REFERENCES playlists(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            url TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_pages_playlist_position ON pages(playlist_id, position);
+        CREATE TABLE IF NOT EXISTS revisions (
+            id INTEGER PRIMARY KEY,
+            playlist_id INTEGER NOT NULL REFERENCES playlists(id) ON DELETE CASCADE,
+            revision INTEGER NOT NULL,
+            config TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_revisions_playlist_revision ON revisions(playlist_id, revision);
+        CREATE INDEX IF NOT EXISTS idx_playlists_active ON playlists(is_active);
+    """
+
+    def __init__(self, db_file: str = "dashboard_config.db"):
+        self.db_file = db_file
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, timeout=10, isolation_level=None)
+        try:
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA busy_timeout=10000")
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Write transaction; BEGIN IMMEDIATE serialises concurrent writers up front"""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _playlist_id(self, conn: sqlite3.Connection, name: str) -> int:
+        row = conn.execute("SELECT id FROM playlists WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise PlaylistNotFoundError(f"Playlist not found: {name}")
+        return row[0]
+
+    def _load(self, conn: sqlite3.Connection, playlist_id: int, settings: str) -> DashboardConfig:
+        rows = conn.execute(
+            "SELECT data FROM pages WHERE playlist_id = ? ORDER BY position",
+            (playlist_id,)
+        ).fetchall()
+        data = json.loads(settings)
+        data["pages"] = [json.loads(row[0]) for row in rows]
+        return DashboardConfig(**data)
+
+    def is_empty(self) -> bool:
+        with self._connect() as conn:
+            return conn.execute("SELECT 1 FROM playlists LIMIT 1").fetchone() is None
+
+    def get_playlist(self, name: str) -> DashboardConfig:
+        with self._connect() as conn:
+            row = conn.execute("SELECT id, settings FROM playlists WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                raise PlaylistNotFoundError(f"Playlist not found: {name}")
+            return self._load(conn, row[0], row[1])
+
+    def get_active_name(self) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT name FROM playlists WHERE is_active = 1").fetchone()
+            return row[0] if row else None
+
+    def list_playlists(self) -> List[Dict[str, Any]]:
+        with self._connect() as conn:
+            rows = conn.execute("""
+                SELECT p.name, p.is_active, p.updated_at,
+                       (SELECT COUNT(*) FROM pages WHERE playlist_id = p.id),
+                       (SELECT MAX(revision) FROM revisions WHERE playlist_id = p.id)
+                FROM playlists p ORDER BY p.name
+            """).fetchall()
+        return [
+            {
+                "name": name,
+                "is_active": bool(is_active),
+                "updated_at": updated_at,
+                "page_count": page_count,
+                "revision": revision or 0,
+            }
+            for name, is_active, updated_at, page_count, revision in rows
+        ]
+
+    def save_playlist(self, name: str, config: DashboardConfig) -> int:
+        """Replace a playlist's settings and pages, recording a new revision. Returns the revision number"""
+        with self._transaction() as conn:
+            return self._save(conn, name, config)
+
+    def seed(self, name: str, config: DashboardConfig) -> bool:
+        """Create and activate a first playlist if the database is empty; returns False if it was not"""
+        with self._transaction() as conn:
+            if conn.execute("SELECT 1 FROM playlists LIMIT 1").fetchone() is not None:
+                return False
+            self._save(conn, name, config)
+            conn.execute("UPDATE playlists SET is_active = 1 WHERE name = ?", (name,))
+        return True
+
+    def _save(self, conn: sqlite3.Connection, name: str, config: DashboardConfig) -> int:
+        data = config.model_dump(mode="json")
+        pages = data.pop("pages")
+        now = datetime.now().isoformat()
+
+        conn.execute(
+            "INSERT INTO playlists (name, settings, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET settings = excluded.settings, updated_at = excluded.updated_at",
+            (name, json.dumps(data), now)
+        )
+        playlist_id = self._playlist_id(conn, name)
+        conn.execute("DELETE FROM pages WHERE playlist_id = ?", (playlist_id,))
+        conn.executemany(
+            "INSERT INTO pages (playlist_id, position, url, data) VALUES (?, ?, ?, ?)",
+            [(playlist_id, position, page["url"], json.dumps(page)) for position, page in enumerate(pages)]
+        )
+        row = conn.execute(
+            "SELECT COALESCE(MAX(revision), 0) + 1 FROM revisions WHERE playlist_id = ?",
+            (playlist_id,)
+        ).fetchone()
+        revision = row[0]
+        conn.execute(
+            "INSERT INTO revisions (playlist_id, revision, config, created_at) VALUES (?, ?, ?, ?)",
+            (playlist_id, revision, json.dumps(config.model_dump(mode="json")), now)
+        )
+        return revision
+
+    def set_active(self, name: str) -> None:
+        with self._transaction() as conn:
+            playlist_id = self._playlist_id(conn, name)
+            conn.execute("UPDATE playlists SET is_active = 0 WHERE is_active = 1")
+            conn.execute("UPDATE playlists SET is_active = 1 WHERE id = ?", (playlist_id,))
+
+    def delete_playlist(self, name: str) -> None:
+        """Delete an inactive playlist; the active check and the delete share one transaction"""
+        with self._transaction() as conn:
+            self._playlist_id(conn, name)
+            cursor = conn.execute("DELETE FROM playlists WHERE name = ? AND is_active = 0", (name,))
+            if cursor.rowcount == 0:
+                raise ValueError("Cannot delete the active playlist")
+
+    def list_revisions(self, name: str) -> List[Dict[str, Any]]:
+        with self._connect() as conn:
+            playlist_id = self._playlist_id(conn, name)
+            rows = conn.execute(
+                "SELECT revision, created_at, config FROM revisions WHERE playlist_id = ? ORDER BY revision DESC",
+                (playlist_id,)
+            ).fetchall()
+        return [
+            {"revision": revision, "created_at": created_at, "page_count": len(json.loads(config)["pages"])}
+            for revision, created_at, config in rows
+        ]
+
+    def get_revision(self, name: str, revision: int) -> DashboardConfig:
+        with self._connect() as conn:
+            playlist_id = self._playlist_id(conn, name)
+            row = conn.execute(
+                "SELECT config FROM revisions WHERE playlist_id = ? AND revision = ?",
+                (playlist_id, revision)
+            ).fetchone()
+        if row is None:
+            raise PlaylistNotFoundError(f"Revision {revision} not found for playlist: {name}")
+        return DashboardConfig(**json.loads(row[0]))
+
+
+class ConfigManager:
+    def __init__(self, config_file: str = "dashboard_config.json", db_file: str = "dashboard_config.db"):
+        self.config_file = config_file
+        self.db_file = db_file
+        self._store: Optional[SQLiteConfigStore] = None
+        self._config: Optional[DashboardConfig] = None
+        self._active_playlist: Optional[str] = None
+        self._lock = threading.RLock()
+
+    @property
+    def store(self) -> SQLiteConfigStore:
+        with self._lock:
+            if self._store is None:
+                store = SQLiteConfigStore(self.db_file)
+                if store.is_empty():
+                    # First run: seed from the JSON file, or defaults
+                    config = self._read_json_file(self.config_file) or self._get_default_config()
+                    store.seed(DEFAULT_PLAYLIST, config)
+                self._store = store
+            return self._store
+
+    @property
+    def active_playlist(self) -> str:
+        if self._active_playlist is None:
+            self.load_config()
+        return self._active_playlist
+
+    def load_config(self) -> DashboardConfig:
+        """Load the active playlist from the database"""
+        with self._lock:
+            name = self.store.get_active_name()
+            if name is None:
+                name = self.store.list_playlists()[0]["name"]
+                self.store.set_active(name)
+
+            self._active_playlist = name
+            self._config = self.store.get_playlist(name)
+            return self._config
+
+    def save_config(self, config: DashboardConfig) -> None:
+        """Save configuration to the active playlist"""
+        self.save_playlist(self.active_playlist, config)
+
+    def get_config(self) -> DashboardConfig:
+        """Get current configuration"""
+        if self._config is None:
+            return self.load_config()
+        return self._config
+
+    def list_playlists(self) -> List[Dict[str, Any]]:
+        """List all playlists"""
+        return self.store.list_playlists()
+
+    def get_playlist(self, name: str) -> DashboardConfig:
+        """Get a playlist by name"""
+        return self.store.get_playlist(name)
+
+    def save_playlist(self, name: str, config: DashboardConfig) -> int:
+        """Create or update a playlist, returning its new revision number"""
+        with self._lock:
+            revision = self.store.save_playlist(name, config)
+            if name == self._active_playlist:
+                self._config = config
+        return revision
+
+    def activate_playlist(self, name: str) -> DashboardConfig:
+        """Make a playlist the active one"""
+        with self._lock:
+            self.store.set_active(name)
+            self._config = self.store.get_playlist(name)
+            self._active_playlist = name
+            return self._config
+
+    def delete_playlist(self, name: str) -> None:
+        """Delete a playlist and its revisions; the active playlist cannot be deleted"""
+        with self._lock:
+            self.store.delete_playlist(name)
+
+    def list_revisions(self, name: str) -> List[Dict[str, Any]]:
+        """List revisions of a playlist, newest first"""
+        return self.store.list_revisions(name)
+
+    def restore_revision(self, name: str, revision: int) -> int:
+        """Save an old revision of a playlist as its newest revision"""
+        return self.save_playlist(name, self.store.get_revision(name, revision))
+
+    def import_json(self, name: str, path: Optional[str] = None) -> int:
+        """Import a JSON config file into a playlist"""
+        config = self._read_json_file(path or self.config_file)
+        if config is None:
+            raise ValueError(f"Could not read config from {path or self.config_file}")
+        return self.save_playlist(name, config)
+
+    def export_json(self, name: Optional[str] = None, path: Optional[str] = None) -> str:
+        """Export a playlist (the active one by default) to a JSON config file"""
+        path = path or self.config_file
+        config = self.get_playlist(name) if name else self.get_config()
+        with open(path, 'w') as f:
+            json.dump(config.model_dump(mode="json"), f, indent=2)
+        return path
+
+    def _read_json_file(self, path: str) -> Optional[DashboardConfig]:
+        """Read a DashboardConfig from a JSON file, or None if missing or invalid"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            return DashboardConfig(**data)
+        except (json.JSONDecodeError, ValueError) as e:
+            print(f"Error loading config: {e}. Using default config.")
+            return None
+
+    def _get_default_config(self) -> DashboardConfig:
+        """Get default configuration"""
+        return DashboardConfig(
+            pages=[
+                PageConfig(
+                    url="https://www.google.com",
+                    duration_seconds=30,
+                    name="Google"
+                ),
+                PageConfig(
+                    url="https://www.github.com",
+                    duration_seconds=45,
+                    name="GitHub"
+                )
+            ],
+            loop=True,
+            auto_start=False
+        )
+
+
+# Global config manager instance
+config_manager = ConfigManager()
@@ -1,272 +1,612 @@
-import time
-import logging
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.service import Service
-from selenium.webdriver.firefox.options import Options
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import WebDriverException
-from typing import Optional, Callable, Union
-from config import config_manager
-from models import DashboardConfig, PageConfig, StatusResponse
-from datetime import datetime
-
-# Browser selection constant - change this to "firefox" to use Firefox instead of Chrome
-BROWSER_TYPE = "chrome"  # Options: "chrome" or "firefox"
-
-
-class DashboardController:
-    def __init__(self):
-        self.driver: Optional[Union[webdriver.Chrome, webdriver.Firefox]] = None
-        self.is_running = False
-        self.current_page_index = 0
-        self.config: Optional[DashboardConfig] = None
-        self.status_callback: Optional[Callable] = None
-        self.logger = logging.getLogger(__name__)
-        self.page_start_time: Optional[float] = None  # Track when current page started
-
-    def set_status_callback(self, callback: Callable):
-        """Set callback for status updates"""
-        self.status_callback = callback
-
-    def start_dashboard(self) -> bool:
-        """Start the dashboard"""
-        try:
-            self.config = config_manager.get_config()
-            if not self.config.pages:
-                self.logger.error("No pages configured")
-                return False
-
-            self._setup_driver()
-            self.is_running = True
-            self.current_page_index = 0
-            self.logger.info("Dashboard started")
-            return True
-        except Exception as e:
-            self.logger.error(f"Failed to start dashboard: {e}")
-            return False
-
-    def stop_dashboard(self):
-        """Stop the dashboard"""
-        self.is_running = False
-        self.page_start_time = None  # Reset page start time
-        if self.driver:
-            try:
-                self.driver.quit()
-            except Exception as e:
-                self.logger.error(f"Error closing driver: {e}")
-            self.driver = None
-        self.logger.info("Dashboard stopped")
-
-    def _setup_driver(self):
-        """Setup browser driver with full-screen options"""
-        if BROWSER_TYPE.lower() == "firefox":
-            self._setup_firefox_driver()
-        else:
-            self._setup_chrome_driver()
-
-    def _setup_chrome_driver(self):
-        """Setup Chrome driver with full-screen options"""
-        chrome_options = ChromeOptions()
-
-        # Full-screen and display options
-        chrome_options.add_argument("--kiosk")  # Full-screen mode
-        chrome_options.add_argument("--start-maximized")  # Start maximized
-
-        # Disable automation indicators
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-default-apps")
-        chrome_options.add_argument("--disable-infobars")  # Remove "Chrome is being controlled by automated test software"
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--allow-running-insecure-content")
-
-        # Disable Google services that cause registration errors
-        chrome_options.add_argument("--disable-background-networking")
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--disable-features=TranslateUI")
-        chrome_options.add_argument("--disable-ipc-flooding-protection")
-        chrome_options.add_argument("--disable-hang-monitor")
-        chrome_options.add_argument("--disable-prompt-on-repost")
-        chrome_options.add_argument("--force-fieldtrials=*BackgroundNetworking/Disabled/")
-        chrome_options.add_argument("--metrics-recording-only")
-        chrome_options.add_argument("--no-first-run")
-        chrome_options.add_argument("--disable-sync")
-        chrome_options.add_argument("--disable-translate")
-        chrome_options.add_argument("--hide-scrollbars")
-        chrome_options.add_argument("--metrics-recording-only")
-        chrome_options.add_argument("--mute-audio")
-        chrome_options.add_argument("--no-default-browser-check")
-        chrome_options.add_argument("--disable-component-update")
-        chrome_options.add_argument("--disable-domain-reliability")
-        chrome_options.add_argument("--disable-client-side-phishing-detection")
-        chrome_options.add_argument("--disable-component-extensions-with-background-pages")
-
-        # Additional stealth options to make it look more like a regular browser
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        chrome_options.add_argument("--disable-blink-features")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor,VizHitTestSurfaceLayer")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-background-media-download")
-        chrome_options.add_argument("--disable-print-preview")
-        chrome_options.add_argument("--disable-component-cloud-policy")
-        chrome_options.add_argument("--disable-hang-monitor")
-        chrome_options.add_argument("--disable-prompt-on-repost")
-
-        # Suppress logging and errors
-        chrome_options.add_argument("--log-level=3")  # Only show fatal errors
-        chrome_options.add_argument("--silent")
-        chrome_options.add_argument("--disable-logging")
-
-        # Experimental options to hide automation (combine with logging exclusion)
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-
-        try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self._apply_stealth_javascript()
-            self.logger.info("Chrome driver initialized successfully")
-        except WebDriverException as e:
-            self.logger.error(f"Failed to initialize Chrome driver: {e}")
-            raise
-
-    def _setup_firefox_driver(self):
-        """Setup Firefox driver with full-screen options"""
-        gecko_driver_path = '/usr/local/bin/geckodriver'
-        service = Service(executable_path=gecko_driver_path)
-        options = Options()
-
-        # Full-screen and display options
-        options.add_argument("--kiosk")  # Full-screen mode
-        options.add_argument("--start-maximized")  # Start maximized
-
-        try:
-            self.driver = webdriver.Firefox(service=service, options=options)
-            self.logger.info("Firefox driver initialized successfully")
-        except WebDriverException as e:
-            self.logger.error(f"Failed to initialize Firefox driver: {e}")
-
-            raise
-        except WebDriverException as e:
-            self.logger.error(f"Failed to initialize Firefox driver: {e}")
-            raise
-
-    def _apply_stealth_javascript(self):
-        """Apply JavaScript stealth modifications to hide automation indicators"""
-        if not self.driver:
-            return
-
-        self.driver.execute_script("""
-            // Hide webdriver property
-            try {
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-            } catch (e) {
-                // Property might already be defined, continue
-            }
-
-            // Mock languages and plugins
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en'],
-            });
-
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5],
-            });
-
-            // Mock permissions
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                Promise.resolve({ state: Notification.permission }) :
-                originalQuery(parameters)
-            );
-        """)
-
-    def run_cycle(self):
-        """Run the dashboard cycle"""
-        if not self.is_running or not self.driver or not self.config:
-            return
-
-        try:
-            page = self.config.pages[self.current_page_index]
-            self.logger.info(f"Loading page: {page.url}")
-
-            # Record when this page started
-            self.page_start_time = time.time()
-
-            self.driver.get(page.url)
-
-            # Wait for page to load
-            time.sleep(2)
-
-            # Update status
-            if self.status_callback:
-                status = self._get_status()
-                self.status_callback(status)
-
-            # Wait for configured duration
-            time.sleep(page.duration_seconds)
-
-            # Move to next page
-            self.current_page_index += 1
-            if self.current_page_index >= len(self.config.pages):
-                if self.config.loop:
-                    self.current_page_index = 0
-                else:
-                    self.stop_dashboard()
-                    return
-
-        except Exception as e:
-            self.logger.error(f"Error in dashboard cycle: {e}")
-            # Try to continue with next page
-            self.current_page_index += 1
-            if self.current_page_index >= len(self.config.pages):
-                self.current_page_index = 0
-
-    def _get_status(self) -> StatusResponse:
-        """Get current status"""
-        if not self.config:
-            return StatusResponse(
-                is_running=False,
-                total_pages=0,
-                last_updated=datetime.now()
-            )
-
-        current_page = None
-        time_remaining = None
-
-        if self.is_running and self.current_page_index < len(self.config.pages):
-            current_page = self.config.pages[self.current_page_index]
-
-            # Calculate actual remaining time
-            if self.page_start_time is not None:
-                elapsed_time = time.time() - self.page_start_time
-                # Account for the 2-second page load delay
-                adjusted_elapsed = max(0, elapsed_time - 2)
-                time_remaining = max(0, int(current_page.duration_seconds - adjusted_elapsed))
-            else:
-                # Fallback to full duration if start time not available
-                time_remaining = current_page.duration_seconds
-
-        return StatusResponse(
-            is_running=self.is_running,
-            current_page_index=self.current_page_index if self.is_running else None,
-            current_page=current_page,
-            time_remaining=time_remaining,
-            total_pages=len(self.config.pages),
-            last_updated=datetime.now()
-        )
-
-
-# Global dashboard controller instance
-dashboard_controller = DashboardController()
-
+import time
+import logging
+import threading
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.service import Service
+from selenium.webdriver.firefox.options import Options
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
+from typing import Optional, Callable, Union, Dict, List
+from config import config_manager
+from models import DashboardConfig, PageConfig, StatusResponse, PageNetworkStats, ProfileStats
+from network import BASELINE_LOAD_INTERVAL, IMAGE_URL_PATTERNS, ResourceSizeCache, apply_network_rules, drain_performance_log, summarize_network_events, supports_cdp
+from page_probe import ContentProbe
+from profiles import ChromeProfile, PROFILE_WARMUP, open_profile
+from tracing import tracer
+from datetime import datetime, time as dt_time
+
+# Browser selection constant - change this to "firefox" to use Firefox instead of Chrome
+BROWSER_TYPE = "chrome"  # Options: "chrome" or "firefox"
+
+# Static page the browser is parked on while idle - no scripts, no network
+IDLE_PAGE_URL = "data:text/html,<html><body style='background:#000'></body></html>"
+IDLE_CHECK_SECONDS = 30  # How often the idle schedule is re-checked
+
+
+class DashboardController:
+    def __init__(self):
+        self.driver: Optional[Union[webdriver.Chrome, webdriver.Firefox]] = None
+        self.is_running = False
+        self.current_page_index = 0
+        self.config: Optional[DashboardConfig] = None
+        self.status_callback: Optional[Callable] = None
+        self.logger = logging.getLogger(__name__)
+        self.page_start_time: Optional[float] = None  # Track when current page started
+        self.main_window_handle: Optional[str] = None  # Tab used by "always" pages
+        self.page_tabs: Dict[int, str] = {}  # Page index -> dedicated tab for keep_alive/conditional pages
+        self.page_loaded_at: Dict[int, float] = {}  # Page index -> last full load/refresh time
+        self.content_probe = ContentProbe()
+        self.pending_config: Optional[DashboardConfig] = None  # Applied at the start of the next cycle
+        self.network_stats: Dict[int, PageNetworkStats] = {}  # Page index -> blocking/load stats
+        self.resource_sizes = ResourceSizeCache()  # Sizes from unblocked loads, for the bytes-saved estimate
+        self.is_idle = False
+        self.idle_override: Optional[bool] = None  # Set by pause/resume, cleared at the next schedule boundary
+        self._last_scheduled_idle: Optional[bool] = None
+        self._wake_event = threading.Event()  # Interrupts display/idle waits
+        self.profile: Optional[ChromeProfile] = None  # Locked persistent Chrome profile
+        self.profile_stats: Optional[ProfileStats] = None  # Kept after stop so cold/warm timings can be compared
+        self.warmup_pending = False  # Profile warm-up still to run on the first non-idle cycle
+
+    def set_status_callback(self, callback: Callable):
+        """Set callback for status updates"""
+        self.status_callback = callback
+
+    def start_dashboard(self) -> bool:
+        """Start the dashboard"""
+        if self.is_running:
+            self.logger.warning("Dashboard is already running")
+            return False
+
+        try:
+            self.config = config_manager.get_config()
+            if not self.config.pages:
+                self.logger.error("No pages configured")
+                return False
+
+            self._setup_driver()
+            self.main_window_handle = self.driver.current_window_handle
+            # Run from the rotation thread so the start request returns straight away
+            self.warmup_pending = self.profile_stats is not None and PROFILE_WARMUP
+            self._wake_event.clear()
+            self.is_running = True
+            self.current_page_index = 0
+            self.logger.info("Dashboard started")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to start dashboard: {e}")
+            if self.driver:
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                self.driver = None
+            # Only set once this start acquired the profile, so another dashboard's lock is never released
+            self._release_profile()
+            self.profile_stats = None
+            return False
+
+    def switch_config(self, config: DashboardConfig):
+        """Switch a running dashboard to another playlist from the next cycle on"""
+        if self.is_running:
+            self.pending_config = config
+
+    def _apply_pending_config(self):
+        """Swap in a pending config, closing tabs kept alive for the old pages"""
+        config, self.pending_config = self.pending_config, None
+        if not config.pages:
+            self.logger.error("Ignoring playlist switch: no pages configured")
+            return
+
+        self._close_page_tabs()
+        self.network_stats.clear()
+        self.resource_sizes.clear()
+        self.content_probe.reset()
+
+        self.config = config
+        self.current_page_index = 0
+        self.logger.info("Switched to new playlist")
+
+    def _close_page_tabs(self):
+        """Close the tabs kept alive for keep_alive/conditional pages"""
+        for handle in self.page_tabs.values():
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except WebDriverException:
+                pass
+        self.driver.switch_to.window(self.main_window_handle)
+        self.page_tabs.clear()
+        self.page_loaded_at.clear()
+
+    def set_idle(self, idle: bool):
+        """Manually enter or leave idle mode until the next idle schedule boundary"""
+        self.idle_override = idle
+        if idle != self.is_idle:
+            self._wake_event.set()
+
+    def _should_be_idle(self) -> bool:
+        """Combine the idle schedule with any manual override"""
+        scheduled = self._scheduled_idle()
+        if scheduled != self._last_scheduled_idle:
+            # A boundary ends any manual override - but the first check is not a boundary
+            if self._last_scheduled_idle is not None:
+                self.idle_override = None
+            self._last_scheduled_idle = scheduled
+        if self.idle_override is not None:
+            return self.idle_override
+        return scheduled
+
+    def _scheduled_idle(self) -> bool:
+        """Whether the configured idle schedule covers the current time"""
+        schedule = self.config.idle_schedule
+        if schedule is None:
+            return False
+
+        now = datetime.now()
+        if schedule.weekends and now.weekday() >= 5:
+            return True
+        current: dt_time = now.time()
+        if schedule.start <= schedule.end:
+            return schedule.start <= current < schedule.end
+        # Window runs overnight, e.g. 19:00 - 07:00
+        return current >= schedule.start or current < schedule.end
+
+    def _enter_idle(self):
+        """Park the browser on a static page and drop the background tabs"""
+        self.logger.info("Entering idle mode")
+        self.is_idle = True
+        self.page_start_time = None
+        self.content_probe.reset()
+        self._close_page_tabs()
+        self.driver.get(IDLE_PAGE_URL)
+
+    def _exit_idle(self):
+        """Resume the rotation at the page we stopped at
+
+        The cycle that follows loads that page under its network rules and counts
+        it as that cycle's load - warming it separately first would fetch it twice.
+        """
+        self.logger.info("Leaving idle mode")
+        self.is_idle = False
+
+    def stop_dashboard(self):
+        """Stop the dashboard"""
+        self.is_running = False
+        self.is_idle = False
+        self.warmup_pending = False
+        self.idle_override = None
+        self._last_scheduled_idle = None
+        self._wake_event.set()
+        self.page_start_time = None  # Reset page start time
+        self.main_window_handle = None
+        self.pending_config = None
+        self.page_tabs.clear()
+        self.page_loaded_at.clear()
+        self.network_stats.clear()
+        self.content_probe.reset()
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                self.logger.error(f"Error closing driver: {e}")
+            self.driver = None
+        self._release_profile()
+        self.logger.info("Dashboard stopped")
+
+    def _release_profile(self):
+        """Unlock the persistent profile once Chrome no longer uses it"""
+        if self.profile:
+            self.profile.release()
+            self.profile = None
+
+    def _setup_driver(self):
+        """Setup browser driver with full-screen options"""
+        if BROWSER_TYPE.lower() == "firefox":
+            self._setup_firefox_driver()
+        else:
+            self._setup_chrome_driver()
+
+    def _setup_chrome_driver(self):
+        """Setup Chrome driver with full-screen options"""
+        chrome_options = ChromeOptions()
+
+        # Full-screen and display options
+        chrome_options.add_argument("--kiosk")  # Full-screen mode
+        chrome_options.add_argument("--start-maximized")  # Start maximized
+
+        # Disable automation indicators
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-plugins")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-infobars")  # Remove "Chrome is being controlled by automated test software"
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-web-security")
+        chrome_options.add_argument("--allow-running-insecure-content")
+
+        # Disable Google services that cause registration errors
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_argument("--disable-features=TranslateUI")
+        chrome_options.add_argument("--disable-ipc-flooding-protection")
+        chrome_options.add_argument("--disable-hang-monitor")
+        chrome_options.add_argument("--disable-prompt-on-repost")
+        chrome_options.add_argument("--force-fieldtrials=*BackgroundNetworking/Disabled/")
+        chrome_options.add_argument("--metrics-recording-only")
+        chrome_options.add_argument("--no-first-run")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-translate")
+        chrome_options.add_argument("--hide-scrollbars")
+        chrome_options.add_argument("--metrics-recording-only")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_argument("--no-default-browser-check")
+        chrome_options.add_argument("--disable-component-update")
+        chrome_options.add_argument("--disable-domain-reliability")
+        chrome_options.add_argument("--disable-client-side-phishing-detection")
+        chrome_options.add_argument("--disable-component-extensions-with-background-pages")
+
+        # Additional stealth options to make it look more like a regular browser
+        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        chrome_options.add_argument("--disable-blink-features")
+        chrome_options.add_argument("--disable-features=VizDisplayCompositor,VizHitTestSurfaceLayer")
+        chrome_options.add_argument("--disable-popup-blocking")
+        chrome_options.add_argument("--disable-notifications")
+        chrome_options.add_argument("--disable-background-media-download")
+        chrome_options.add_argument("--disable-print-preview")
+        chrome_options.add_argument("--disable-component-cloud-policy")
+        chrome_options.add_argument("--disable-hang-monitor")
+        chrome_options.add_argument("--disable-prompt-on-repost")
+
+        # Suppress logging and errors
+        chrome_options.add_argument("--log-level=3")  # Only show fatal errors
+        chrome_options.add_argument("--silent")
+        chrome_options.add_argument("--disable-logging")
+
+        # Experimental options to hide automation (combine with logging exclusion)
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
+        chrome_options.add_experimental_option("useAutomationExtension", False)
+
+        # DevTools network events, used to count blocked requests and transferred bytes per page
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        # Persistent profile keeps the HTTP cache, service workers and logins across restarts
+        profile = open_profile()
+        profile_stats = None
+        if profile:
+            cache_size = profile.cache_size()
+            removed = profile.cleanup()
+            for argument in profile.chrome_arguments():
+                chrome_options.add_argument(argument)
+            profile_stats = ProfileStats(
+                display_name=profile.display_name,
+                profile_dir=profile.path,
+                reused=cache_size > 0,
+                cache_size_bytes=cache_size - removed,
+                removed_bytes=removed
+            )
+
+        try:
+            self.driver = webdriver.Chrome(options=chrome_options)
+        except WebDriverException as e:
+            self.logger.error(f"Failed to initialize Chrome driver: {e}")
+            if profile:
+                profile.release()
+            raise
+        self.profile = profile
+        self.profile_stats = profile_stats
+        self._apply_stealth_javascript()
+        self.logger.info("Chrome driver initialized successfully")
+
+    def _setup_firefox_driver(self):
+        """Setup Firefox driver with full-screen options"""
+        gecko_driver_path = '/usr/local/bin/geckodriver'
+        service = Service(executable_path=gecko_driver_path)
+        options = Options()
+
+        # Full-screen and display options
+        options.add_argument("--kiosk")  # Full-screen mode
+        options.add_argument("--start-maximized")  # Start maximized
+
+        try:
+            self.driver = webdriver.Firefox(service=service, options=options)
+            self.logger.info("Firefox driver initialized successfully")
+        except WebDriverException as e:
+            self.logger.error(f"Failed to initialize Firefox driver: {e}")
+
+            raise
+        except WebDriverException as e:
+            self.logger.error(f"Failed to initialize Firefox driver: {e}")
+            raise
+
+    def _apply_stealth_javascript(self):
+        """Apply JavaScript stealth modifications to hide automation indicators"""
+        if not self.driver:
+            return
+
+        self.driver.execute_script("""
+            // Hide webdriver property
+            try {
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined,
+                });
+            } catch (e) {
+                // Property might already be defined, continue
+            }
+
+            // Mock languages and plugins
+            Object.defineProperty(navigator, 'languages', {
+                get: () => ['en-US', 'en'],
+            });
+
+            Object.defineProperty(navigator, 'plugins', {
+                get: () => [1, 2, 3, 4, 5],
+            });
+
+            // Mock permissions
+            const originalQuery = window.navigator.permissions.query;
+            window.navigator.permissions.query = (parameters) => (
+                parameters.name === 'notifications' ?
+                Promise.resolve({ state: Notification.permission }) :
+                originalQuery(parameters)
+            );
+        """)
+
+    def run_cycle(self):
+        """Run the dashboard cycle"""
+        if not self.is_running or not self.driver or not self.config:
+            return
+
+        if self.pending_config is not None:
+            self._apply_pending_config()
+
+        try:
+            if self._should_be_idle():
+                if not self.is_idle:
+                    self._enter_idle()
+                self._wake_event.wait(IDLE_CHECK_SECONDS)
+                self._wake_event.clear()
+                return
+            if self.is_idle:
+                self._exit_idle()
+        except Exception as e:
+            self.logger.error(f"Error switching idle mode: {e}")
+            return
+
+        if self.warmup_pending:
+            self.warmup_pending = False
+            self._warm_up_profile()
+
+        with tracer.trace("rotation_cycle", page_index=self.current_page_index):
+            try:
+                page = self.config.pages[self.current_page_index]
+                baseline = self._is_baseline_load(self.current_page_index, page)
+                self.logger.info(f"Loading page: {page.url}" + (" (baseline, no blocklist)" if baseline else ""))
+
+                # Record when this page started
+                self.page_start_time = time.time()
+
+                with tracer.span("navigate", url=page.url, refresh_policy=page.refresh_policy):
+                    loaded = self._show_page(self.current_page_index, page, baseline)
+
+                # Wait for page to load
+                with tracer.span("readiness_wait"):
+                    time.sleep(2)
+
+                if loaded:
+                    self._record_network_stats(self.current_page_index, page, baseline)
+
+                # Update status
+                if self.status_callback:
+                    with tracer.span("callback"):
+                        status = self._get_status()
+                        self.status_callback(status)
+
+                # Probe the next page while this one is on screen
+                self._probe_next_page()
+
+                # Wait for configured duration
+                with tracer.span("display", duration_seconds=page.duration_seconds):
+                    interrupted = self._wake_event.wait(page.duration_seconds)
+                if interrupted:
+                    # Idle or stop requested mid-page: keep our position so resume picks up here
+                    self._wake_event.clear()
+                    return
+
+                # Move to next page
+                self.current_page_index += 1
+                if self.current_page_index >= len(self.config.pages):
+                    if self.config.loop:
+                        self.current_page_index = 0
+                    else:
+                        self.stop_dashboard()
+                        return
+
+            except Exception as e:
+                self.logger.error(f"Error in dashboard cycle: {e}")
+                # Try to continue with next page
+                self.current_page_index += 1
+                if self.current_page_index >= len(self.config.pages):
+                    self.current_page_index = 0
+
+    def _show_page(self, index: int, page: PageConfig, baseline: bool = False) -> bool:
+        """Bring a page on screen according to its refresh policy; returns True if it was (re)loaded"""
+        if page.refresh_policy == "always":
+            self.driver.switch_to.window(self.main_window_handle)
+            self._prepare_network(page, baseline)
+            self.driver.get(page.url)
+            return True
+
+        handle = self.page_tabs.get(index)
+        if handle is None or handle not in self.driver.window_handles:
+            # First visit: give the page its own tab and keep it alive from now on
+            self.driver.switch_to.new_window("tab")
+            self.page_tabs[index] = self.driver.current_window_handle
+            self._prepare_network(page, baseline)
+            self.driver.get(page.url)
+            self.page_loaded_at[index] = time.time()
+            if page.refresh_policy == "conditional":
+                self.content_probe.prime(page.url)
+            return True
+
+        self.driver.switch_to.window(handle)
+        if page.refresh_policy == "keep_alive":
+            needs_refresh = time.time() - self.page_loaded_at.get(index, 0) >= page.refresh_interval_seconds
+        else:
+            needs_refresh = self.content_probe.result(page.url)
+
+        if needs_refresh:
+            self.logger.info(f"Refreshing page: {page.url}")
+            self._prepare_network(page, baseline)
+            self.driver.refresh()
+            self.page_loaded_at[index] = time.time()
+        else:
+            self.logger.info(f"Reusing unchanged page: {page.url}")
+        return needs_refresh
+
+    def _blocked_urls(self, page: PageConfig) -> List[str]:
+        blocked_urls = self.config.blocked_urls + page.blocked_urls
+        if page.block_images:
+            blocked_urls = blocked_urls + IMAGE_URL_PATTERNS
+        return blocked_urls
+
+    def _is_baseline_load(self, index: int, page: PageConfig) -> bool:
+        """Whether the page's next load should skip the blocklist to measure what it saves"""
+        if not self._blocked_urls(page) or not supports_cdp(self.driver):
+            return False
+        stats = self.network_stats.get(index)
+        loads = stats.loads + stats.baseline_loads if stats else 0
+        return loads % BASELINE_LOAD_INTERVAL == 1
+
+    def _prepare_network(self, page: PageConfig, baseline: bool = False):
+        """Apply blocklists and throttling to the current tab before a page loads"""
+        blocked_urls = [] if baseline else self._blocked_urls(page)
+        apply_network_rules(self.driver, blocked_urls, page.network_throttle or self.config.network_throttle)
+        # Drop events from earlier pages so the next stats only cover this load
+        drain_performance_log(self.driver)
+
+    def _record_network_stats(self, index: int, page: PageConfig, baseline: bool = False):
+        """Add the blocked requests, transferred bytes and load time of the last load to the page's stats"""
+        stats = self.network_stats.get(index)
+        if stats is None:
+            stats = PageNetworkStats(page_index=index, url=page.url, name=page.name)
+            self.network_stats[index] = stats
+
+        blocked, transferred, sizes = summarize_network_events(drain_performance_log(self.driver))
+        self.resource_sizes.record(sizes)
+        load_time = self._page_load_time_ms()
+
+        if baseline:
+            stats.baseline_loads += 1
+            if load_time is not None:
+                stats.baseline_timed_loads += 1
+                previous_average = stats.average_baseline_load_time_ms or 0
+                stats.average_baseline_load_time_ms = int(
+                    previous_average + (load_time - previous_average) / stats.baseline_timed_loads
+                )
+            return
+
+        stats.loads += 1
+        stats.blocked_requests += len(blocked)
+        stats.transferred_bytes += transferred
+        stats.bytes_saved_estimate += self.resource_sizes.estimate(blocked)
+
+        if self.profile_stats is not None and page.url not in self.profile_stats.first_cycle_load_times_ms:
+            self.profile_stats.first_cycle_load_times_ms[page.url] = load_time
+        if load_time is not None:
+            stats.timed_loads += 1
+            stats.last_load_time_ms = int(load_time)
+            previous_average = stats.average_load_time_ms or 0
+            stats.average_load_time_ms = int(previous_average + (load_time - previous_average) / stats.timed_loads)
+
+    def _page_load_time_ms(self) -> Optional[int]:
+        """Navigation-to-load time of the current tab, or None if it has not finished loading"""
+        try:
+            load_time = self.driver.execute_script(
+                "const t = performance.timing;"
+                "return t.loadEventEnd > 0 ? t.loadEventEnd - t.navigationStart : null;"
+            )
+        except WebDriverException:
+            return None
+        return int(load_time) if load_time is not None else None
+
+    def _warm_up_profile(self):
+        """Visit every configured page once so the first real cycle loads from a warm cache"""
+        with tracer.trace("profile_warmup", reused=self.profile_stats.reused):
+            for page in self.config.pages:
+                if not self.is_running:
+                    break
+                if page.url in self.profile_stats.warmup_load_times_ms:
+                    continue
+                try:
+                    with tracer.span("navigate", url=page.url):
+                        self._prepare_network(page)
+                        self.driver.get(page.url)
+                    self.profile_stats.warmup_load_times_ms[page.url] = self._page_load_time_ms()
+                except WebDriverException as e:
+                    self.logger.warning(f"Warm-up of {page.url} failed: {e}")
+        self.logger.info(f"Profile warm-up finished for {len(self.profile_stats.warmup_load_times_ms)} pages")
+
+    def get_profile_stats(self) -> Optional[ProfileStats]:
+        """Get the persistent profile state and warm-up vs first-cycle load times"""
+        return self.profile_stats
+
+    def get_network_stats(self) -> List[PageNetworkStats]:
+        """Get per-page blocking and load-time stats"""
+        return [self.network_stats[index] for index in sorted(self.network_stats)]
+
+    def _probe_next_page(self):
+        """Start the change probe for the next page ahead of its turn"""
+        next_index = self.current_page_index + 1
+        if next_index >= len(self.config.pages):
+            if not self.config.loop:
+                return
+            next_index = 0
+
+        page = self.config.pages[next_index]
+        if page.refresh_policy == "conditional" and next_index in self.page_tabs:
+            self.content_probe.submit(page.url)
+
+    def _get_status(self) -> StatusResponse:
+        """Get current status"""
+        if not self.config:
+            return StatusResponse(
+                is_running=False,
+                total_pages=0,
+                last_updated=datetime.now()
+            )
+
+        current_page = None
+        time_remaining = None
+
+        if self.is_running and not self.is_idle and self.current_page_index < len(self.config.pages):
+            current_page = self.config.pages[self.current_page_index]
+
+            # Calculate actual remaining time
+            if self.page_start_time is not None:
+                elapsed_time = time.time() - self.page_start_time
+                # Account for the 2-second page load delay
+                adjusted_elapsed = max(0, elapsed_time - 2)
+                time_remaining = max(0, int(current_page.duration_seconds - adjusted_elapsed))
+            else:
+                # Fallback to full duration if start time not available
+                time_remaining = current_page.duration_seconds
+
+        return StatusResponse(
+            is_running=self.is_running,
+            is_idle=self.is_idle,
+            current_page_index=self.current_page_index if self.is_running else None,
+            current_page=current_page,
+            time_remaining=time_remaining,
+            total_pages=len(self.config.pages),
+            last_updated=datetime.now()
+        )
+
+
+# Global dashboard controller instance
+dashboard_controller = DashboardController()
+
@@ -1,58 +1,123 @@
-from pydantic import BaseModel
-from typing import List, Optional
-from datetime import datetime
-
-
-class PageConfig(BaseModel):
-    url: str
-    duration_seconds: int
-    name: Optional[str] = None
-
-
-class DashboardConfig(BaseModel):
-    pages: List[PageConfig]
-    loop: bool = True
-    auto_start: bool = False
-
-
-class StatusResponse(BaseModel):
-    is_running: bool
-    current_page_index: Optional[int] = None
-    current_page: Optional[PageConfig] = None
-    time_remaining: Optional[int] = None
-    total_pages: int
-    last_updated: datetime
-
-
-class ConfigUpdateRequest(BaseModel):
-    config: DashboardConfig
-
-
-class ControlRequest(BaseModel):
-    action: str  # "start", "stop", "pause", "resume"
-
-
-# Authentication models
-class User(BaseModel):
-    username: str
-    email: Optional[str] = None
-    full_name: Optional[str] = None
-    disabled: bool = False
-
-
-class UserInDB(User):
-    hashed_password: str
-
-
-class LoginRequest(BaseModel):
-    username: str
-    password: str
-
-
-class Token(BaseModel):
-    access_token: str
-    token_type: str
-
-
-class TokenData(BaseModel):
-    username: Optional[str] = None
+from pydantic import BaseModel
+from typing import Dict, List, Literal, Optional
+from datetime import datetime, time
+
+
+class NetworkThrottle(BaseModel):
+    download_kbps: Optional[int] = None  # None = unlimited
+    upload_kbps: Optional[int] = None  # None = unlimited
+    latency_ms: int = 0
+
+
+class PageConfig(BaseModel):
+    url: str
+    duration_seconds: int
+    name: Optional[str] = None
+    # "always": full reload every time the page comes round
+    # "keep_alive": keep the page open in its own tab and soft-refresh it every refresh_interval_seconds
+    # "conditional": keep the page open in its own tab and reload only when a HEAD probe shows a change
+    refresh_policy: Literal["always", "keep_alive", "conditional"] = "always"
+    refresh_interval_seconds: int = 300
+    # URL patterns blocked through CDP (Chrome only), e.g. "*google-analytics.com*"; added to the global list
+    blocked_urls: List[str] = []
+    block_images: bool = False
+    network_throttle: Optional[NetworkThrottle] = None  # Overrides the global throttle
+
+
+class IdleSchedule(BaseModel):
+    start: time  # e.g. "19:00", local time
+    end: time  # e.g. "07:00"; earlier than start means the window runs overnight
+    weekends: bool = False  # Idle all day on Saturday and Sunday
+
+
+class DashboardConfig(BaseModel):
+    pages: List[PageConfig]
+    loop: bool = True
+    auto_start: bool = False
+    blocked_urls: List[str] = []  # Blocked on every page
+    network_throttle: Optional[NetworkThrottle] = None
+    idle_schedule: Optional[IdleSchedule] = None
+
+
+class PageNetworkStats(BaseModel):
+    page_index: int
+    url: str
+    name: Optional[str] = None
+    loads: int = 0
+    timed_loads: int = 0  # Loads whose load event fired within the readiness wait
+    blocked_requests: int = 0
+    transferred_bytes: int = 0
+    bytes_saved_estimate: int = 0  # Sizes of blocked resources as seen in baseline loads
+    last_load_time_ms: Optional[int] = None
+    average_load_time_ms: Optional[int] = None
+    baseline_loads: int = 0  # Loads made without the blocklist, not counted above
+    baseline_timed_loads: int = 0
+    average_baseline_load_time_ms: Optional[int] = None
+
+
+class ProfileStats(BaseModel):
+    display_name: str
+    profile_dir: str
+    reused: bool  # Profile already held cache data when the dashboard started
+    cache_size_bytes: int
+    removed_bytes: int = 0  # Old cache data removed by the size-based cleanup
+    warmup_load_times_ms: Dict[str, Optional[int]] = {}  # Startup pass, cold if the profile was new
+    first_cycle_load_times_ms: Dict[str, Optional[int]] = {}  # First real rotation, after warm-up
+
+
+class StatusResponse(BaseModel):
+    is_running: bool
+    is_idle: bool = False
+    current_page_index: Optional[int] = None
+    current_page: Optional[PageConfig] = None
+    time_remaining: Optional[int] = None
+    total_pages: int
+    last_updated: datetime
+
+
+class ConfigUpdateRequest(BaseModel):
+    config: DashboardConfig
+
+
+class PlaylistInfo(BaseModel):
+    name: str
+    is_active: bool
+    page_count: int
+    revision: int
+    updated_at: datetime
+
+
+class RevisionInfo(BaseModel):
+    revision: int
+    created_at: datetime
+    page_count: int
+
+
+class ControlRequest(BaseModel):
+    action: str  # "start", "stop", "pause", "resume"
+
+
+# Authentication models
+class User(BaseModel):
+    username: str
+    email: Optional[str] = None
+    full_name: Optional[str] = None
+    disabled: bool = False
+
+
+class UserInDB(User):
+    hashed_password: str
+
+
+class LoginRequest(BaseModel):
+    username: str
+    password: str
+
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str
+
+
+class TokenData(BaseModel):
+    username: Optional[str] = None
@@ -0,0 +1,131 @@
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from models import NetworkThrottle
+
+# Patterns added to the blocklist for pages with block_images enabled
+IMAGE_EXTENSIONS = ["png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "bmp", "avif"]
+# Each extension with and without a query string, so versioned CDN URLs such as
+# logo.png?v=3 match but iconify.min.js or static.gifts.example.com/app.js do not
+IMAGE_URL_PATTERNS = [pattern for ext in IMAGE_EXTENSIONS for pattern in (f"*.{ext}", f"*.{ext}?*")]
+
+# Resource sizes remembered for the bytes-saved estimate
+RESOURCE_SIZE_CACHE_ENTRIES = 5000
+# Every Nth load of a page with blocking rules skips the blocklist, to measure what
+# the blocked resources cost. The first is the second load, once the cache is warm
+BASELINE_LOAD_INTERVAL = 10
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceSizeCache:
+    """Bounded LRU of transfer sizes seen in earlier, unblocked loads
+
+    Blocked resources are never downloaded, so their size is only known from
+    an unblocked baseline load (see BASELINE_LOAD_INTERVAL).
+    URLs are keyed without their query string so cache-busting beacons match.
+    """
+
+    def __init__(self, max_entries: int = RESOURCE_SIZE_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return url.split("#", 1)[0].split("?", 1)[0]
+
+    def record(self, sizes: Dict[str, int]):
+        with self._lock:
+            for url, size in sizes.items():
+                key = self._key(url)
+                # Cache revalidations transfer only headers; keep the largest size seen
+                self._sizes[key] = max(size, self._sizes.get(key, 0))
+                self._sizes.move_to_end(key)
+            while len(self._sizes) > self.max_entries:
+                self._sizes.popitem(last=False)
+
+    def estimate(self, urls: List[str]) -> int:
+        """Sum of the known sizes of the given URLs; unknown ones count as 0"""
+        with self._lock:
+            return sum(self._sizes.get(self._key(url), 0) for url in urls)
+
+    def clear(self):
+        with self._lock:
+            self._sizes.clear()
+
+
+def supports_cdp(driver) -> bool:
+    """Only Chromium-based drivers speak the DevTools protocol"""
+    return hasattr(driver, "execute_cdp_cmd")
+
+
+def apply_network_rules(driver, blocked_urls: List[str], throttle: Optional[NetworkThrottle] = None):
+    """Apply URL blocking and bandwidth limits to the current tab through CDP"""
+    if not supports_cdp(driver):
+        return
+
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+
+    if throttle is None:
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": 0,
+            "downloadThroughput": -1,
+            "uploadThroughput": -1,
+        })
+    else:
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": throttle.latency_ms,
+            "downloadThroughput": throttle.download_kbps * 125 if throttle.download_kbps else -1,
+            "uploadThroughput": throttle.upload_kbps * 125 if throttle.upload_kbps else -1,
+        })
+
+
+def drain_performance_log(driver) -> List[Dict[str, Any]]:
+    """Read (and thereby clear) the DevTools events chromedriver has buffered"""
+    if not supports_cdp(driver):
+        return []
+    try:
+        entries = driver.get_log("performance")
+    except Exception as e:
+        logger.debug(f"Performance log unavailable: {e}")
+        return []
+
+    events = []
+    for entry in entries:
+        try:
+            events.append(json.loads(entry["message"])["message"])
+        except (KeyError, ValueError):
+            continue
+    return events
+
+
+def summarize_network_events(events: List[Dict[str, Any]]) -> Tuple[List[str], int, Dict[str, int]]:
+    """Return the URLs blocked by our blocklist, the bytes actually transferred and the size of each loaded URL"""
+    request_urls: Dict[str, str] = {}
+    blocked: List[str] = []
+    transferred = 0
+    sizes: Dict[str, int] = {}
+
+    for event in events:
+        method = event.get("method")
+        params = event.get("params", {})
+        if method == "Network.requestWillBeSent":
+            request_urls[params.get("requestId")] = params.get("request", {}).get("url", "")
+        elif method == "Network.loadingFailed":
+            # "inspector" is the reason Chrome reports for Network.setBlockedURLs matches
+            if params.get("blockedReason") == "inspector":
+                blocked.append(request_urls.get(params.get("requestId"), ""))
+        elif method == "Network.loadingFinished":
+            size = int(params.get("encodedDataLength", 0))
+            transferred += size
+            url = request_urls.get(params.get("requestId"))
+            if url:
+                sizes[url] = size
+
+    return blocked, transferred, sizes
@@ -0,0 +1,116 @@
+import http.client
+import logging
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+
+class ContentProbe:
+    """Cheap HEAD probes that tell whether a page changed since it was last seen.
+
+    Validators (ETag / Last-Modified) are remembered per URL and sent back as
+    If-None-Match / If-Modified-Since. Anything inconclusive counts as changed,
+    so a page is never left stale because of a failed probe.
+    """
+
+    def __init__(self, timeout: float = 5.0, max_workers: int = 4):
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._pending: Dict[str, Future] = {}
+        self._priming: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="page-probe")
+
+    def has_changed(self, url: str) -> bool:
+        """Probe the URL now and return True if its content changed"""
+        with self._lock:
+            previous = self._validators.get(url)
+
+        try:
+            request = urllib.request.Request(url, method="HEAD")
+            if previous:
+                etag, last_modified = previous
+                if etag:
+                    request.add_header("If-None-Match", etag)
+                if last_modified:
+                    request.add_header("If-Modified-Since", last_modified)
+
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                current = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return False
+            self.logger.debug(f"Probe of {url} returned HTTP {e.code}")
+            return True
+        except (urllib.error.URLError, OSError, http.client.HTTPException, ValueError) as e:
+            # Unreachable host, malformed response or URL urllib cannot handle
+            self.logger.debug(f"Probe of {url} failed: {e}")
+            return True
+
+        if current == (None, None):
+            # Server gives us nothing to compare against
+            return True
+
+        with self._lock:
+            self._validators[url] = current
+
+        if previous is None:
+            return True
+        if current[0] and previous[0]:
+            return current[0] != previous[0]
+        if current[1] and previous[1]:
+            return current[1] != previous[1]
+        return True
+
+    def prime(self, url: str):
+        """Record the current validators for a freshly loaded page in the background"""
+        with self._lock:
+            self._priming[url] = self._executor.submit(self.has_changed, url)
+
+    def _probe_after_priming(self, url: str, priming: Future) -> bool:
+        # Without this a probe racing the priming one would see no validators and report a change
+        try:
+            priming.result(timeout=self.timeout)
+        except Exception:
+            pass
+        return self.has_changed(url)
+
+    def submit(self, url: str) -> Future:
+        """Start a probe in the background, ahead of the page's turn"""
+        with self._lock:
+            future = self._pending.get(url)
+            if future is None:
+                priming = self._priming.pop(url, None)
+                if priming is not None and not priming.done():
+                    future = self._executor.submit(self._probe_after_priming, url, priming)
+                else:
+                    future = self._executor.submit(self.has_changed, url)
+                self._pending[url] = future
+        return future
+
+    def result(self, url: str) -> bool:
+        """Collect the background probe for the URL, probing now if none is pending"""
+        with self._lock:
+            future = self._pending.pop(url, None)
+            priming = self._priming.pop(url, None)
+        if future is None:
+            if priming is not None:
+                return self._probe_after_priming(url, priming)
+            return self.has_changed(url)
+        try:
+            return future.result(timeout=self.timeout)
+        except Exception as e:
+            self.logger.debug(f"Probe of {url} did not complete: {e}")
+            return True
+
+    def reset(self):
+        """Drop pending probes and remembered validators"""
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._priming.clear()
+            self._validators.clear()
@@ -0,0 +1,148 @@
+import logging
+import os
+import shutil
+from typing import List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Persistent Chrome profiles, one directory per display under PROFILE_ROOT
+USE_PERSISTENT_PROFILE = True
+PROFILE_ROOT = "chrome_profiles"
+DISPLAY_NAME = "default"  # Give each display on the same machine its own name
+DISK_CACHE_SIZE_MB = 512  # HTTP cache, capped by Chrome itself through --disk-cache-size
+OTHER_CACHE_LIMIT_MB = 256  # Code/service-worker/GPU caches, which --disk-cache-size does not cover
+PROFILE_WARMUP = True  # Pre-visit every configured page at startup
+
+# Chrome's HTTP cache; sized by --disk-cache-size, so cleanup leaves it alone
+HTTP_CACHE_DIR = os.path.join("Default", "Cache")
+
+# Profile subdirectories holding disposable cache data. Each is removed as a
+# whole - deleting single files would corrupt the backend's index
+OTHER_CACHE_DIRS = [
+    os.path.join("Default", "Code Cache"),
+    os.path.join("Default", "Service Worker", "CacheStorage"),
+    os.path.join("Default", "GPUCache"),
+    "ShaderCache",
+    "GrShaderCache",
+]
+
+LOCK_FILE = "dashboard.lock"
+
+
+class ProfileLockedError(RuntimeError):
+    """Raised when another dashboard already drives the profile"""
+
+
+class ChromeProfile:
+    """A persistent Chrome user-data-dir, locked to a single driver at a time"""
+
+    def __init__(self, display_name: str = DISPLAY_NAME, root: str = PROFILE_ROOT,
+                 disk_cache_mb: int = DISK_CACHE_SIZE_MB, other_cache_limit_mb: int = OTHER_CACHE_LIMIT_MB):
+        self.display_name = display_name
+        self.path = os.path.abspath(os.path.join(root, display_name))
+        self.disk_cache_mb = disk_cache_mb
+        self.other_cache_limit_mb = other_cache_limit_mb
+        self.logger = logging.getLogger(__name__)
+        self._lock_file = None
+
+    def acquire(self):
+        """Lock the profile; the OS drops the lock if this process dies"""
+        os.makedirs(self.path, exist_ok=True)
+        lock_file = open(os.path.join(self.path, LOCK_FILE), "a+")
+        try:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            raise ProfileLockedError(f"Chrome profile is in use by another dashboard: {self.path}")
+
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._lock_file = lock_file
+
+    def release(self):
+        """Unlock the profile"""
+        if self._lock_file is None:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+            else:
+                self._lock_file.seek(0)
+                msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError as e:
+            self.logger.warning(f"Error unlocking profile {self.path}: {e}")
+        finally:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _dir_usage(self, cache_dir: str) -> Tuple[int, float]:
+        """Total size and newest modification time of the files under a cache directory"""
+        size = 0
+        newest = 0.0
+        stack = [os.path.join(self.path, cache_dir)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            stat = entry.stat()
+                            size += stat.st_size
+                            newest = max(newest, stat.st_mtime)
+            except OSError:
+                continue
+        return size, newest
+
+    def cache_size(self) -> int:
+        """Total bytes of cache data in the profile"""
+        return sum(self._dir_usage(cache_dir)[0] for cache_dir in [HTTP_CACHE_DIR] + OTHER_CACHE_DIRS)
+
+    def cleanup(self) -> int:
+        """Remove whole cache directories, least recently used first, until they fit the limit; returns bytes removed"""
+        usage = []
+        for cache_dir in OTHER_CACHE_DIRS:
+            size, newest = self._dir_usage(cache_dir)
+            if size:
+                usage.append((newest, size, cache_dir))
+
+        total = sum(size for _, size, _ in usage)
+        limit = self.other_cache_limit_mb * 1024 * 1024
+        removed = 0
+        for _, size, cache_dir in sorted(usage):
+            if total - removed <= limit:
+                break
+            try:
+                shutil.rmtree(os.path.join(self.path, cache_dir))
+                removed += size
+            except OSError as e:
+                self.logger.warning(f"Could not remove {cache_dir} from {self.path}: {e}")
+
+        if removed:
+            self.logger.info(f"Removed {removed // (1024 * 1024)} MB of old cache data from {self.path}")
+        return removed
+
+    def chrome_arguments(self) -> List[str]:
+        return [
+            f"--user-data-dir={self.path}",
+            f"--disk-cache-size={self.disk_cache_mb * 1024 * 1024}",
+        ]
+
+
+def open_profile(display_name: Optional[str] = None) -> Optional[ChromeProfile]:
+    """Lock the display's persistent profile, or return None when persistent profiles are off"""
+    if not USE_PERSISTENT_PROFILE:
+        return None
+    profile = ChromeProfile(display_name or DISPLAY_NAME)
+    profile.acquire()
+    return profile
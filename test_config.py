@@ -0,0 +1,76 @@
+import os
+import threading
+
+import pytest
+
+from config import ConfigManager, PlaylistNotFoundError
+from models import DashboardConfig, PageConfig
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ConfigManager(
+        config_file=os.path.join(tmp_path, "dashboard_config.json"),
+        db_file=os.path.join(tmp_path, "dashboard_config.db")
+    )
+
+
+def make_config(url: str) -> DashboardConfig:
+    return DashboardConfig(pages=[PageConfig(url=url, duration_seconds=30)])
+
+
+def test_concurrent_first_use_seeds_once(manager):
+    threads = [threading.Thread(target=manager.list_playlists) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    playlists = manager.list_playlists()
+    assert [p["name"] for p in playlists] == ["default"]
+    assert playlists[0]["revision"] == 1
+    assert playlists[0]["is_active"]
+
+
+def test_active_playlist_cannot_be_deleted(manager):
+    manager.save_playlist("ops", make_config("https://ops.example.com"))
+    manager.activate_playlist("ops")
+
+    with pytest.raises(ValueError):
+        manager.delete_playlist("ops")
+    manager.delete_playlist("default")
+
+    assert [p["name"] for p in manager.list_playlists()] == ["ops"]
+
+
+def test_missing_playlist_message(manager):
+    with pytest.raises(PlaylistNotFoundError) as exc_info:
+        manager.get_playlist("nope")
+    assert str(exc_info.value) == "Playlist not found: nope"
+
+
+def test_revisions_and_restore(manager):
+    manager.save_config(make_config("https://one.example.com"))
+    manager.save_config(make_config("https://two.example.com"))
+
+    assert [r["revision"] for r in manager.list_revisions("default")] == [3, 2, 1]
+    manager.restore_revision("default", 2)
+    assert manager.get_config().pages[0].url == "https://one.example.com"
+
+
+def test_idle_schedule_round_trips(manager, tmp_path):
+    config = DashboardConfig(
+        pages=[PageConfig(url="https://night.example.com", duration_seconds=60)],
+        idle_schedule={"start": "19:00", "end": "07:00", "weekends": True}
+    )
+    manager.save_playlist("night", config)
+
+    assert manager.get_playlist("night") == config
+    assert manager.store.get_revision("night", 1) == config
+
+    exported = manager.export_json("night", os.path.join(tmp_path, "night.json"))
+    reloaded = ConfigManager(
+        config_file=exported,
+        db_file=os.path.join(tmp_path, "fresh.db")
+    )
+    assert reloaded.get_config() == config
@@ -0,0 +1,255 @@
+import json
+import os
+from datetime import datetime
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+import main
+from config import ConfigManager
+from main import IDLE_PAGE_URL, DashboardController
+from models import DashboardConfig, IdleSchedule, PageConfig, ProfileStats
+from network import BASELINE_LOAD_INTERVAL
+from profiles import ChromeProfile
+
+
+class FakeSwitchTo:
+    def window(self, handle):
+        pass
+
+
+class FakeDriver:
+    """Enough of a Chrome driver for the controller's bookkeeping: CDP calls, performance log, load timing"""
+
+    current_window_handle = "main"
+    window_handles = ["main"]
+
+    def __init__(self):
+        self.blocked_urls = None
+        self.log = []
+        self.load_time_ms = 100
+        self.visited = []
+        self.switch_to = FakeSwitchTo()
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == "Network.setBlockedURLs":
+            self.blocked_urls = params["urls"]
+
+    def get_log(self, log_type):
+        entries, self.log = self.log, []
+        return entries
+
+    def execute_script(self, script):
+        return self.load_time_ms
+
+    def emit(self, method, **params):
+        self.log.append({"message": json.dumps({"message": {"method": method, "params": params}})})
+
+    def load(self, request_id, url, size=None):
+        self.emit("Network.requestWillBeSent", requestId=request_id, request={"url": url})
+        if size is None:
+            self.emit("Network.loadingFailed", requestId=request_id, blockedReason="inspector")
+        else:
+            self.emit("Network.loadingFinished", requestId=request_id, encodedDataLength=size)
+
+
+@pytest.fixture
+def controller():
+    controller = DashboardController()
+    controller.driver = FakeDriver()
+    controller.config = DashboardConfig(
+        pages=[PageConfig(url="https://sales.example.com", duration_seconds=30)],
+        blocked_urls=["*intercom*"]
+    )
+    return controller
+
+
+def record_load(controller, baseline):
+    page = controller.config.pages[0]
+    controller._prepare_network(page, baseline)
+    controller.driver.load("1", page.url, size=1000)
+    controller.driver.load("2", "https://widget.intercom.io/app.js", size=None if not baseline else 400)
+    controller._record_network_stats(0, page, baseline)
+
+
+def test_baseline_every_interval_starting_with_second_load(controller):
+    page = controller.config.pages[0]
+    schedule = []
+    for _ in range(BASELINE_LOAD_INTERVAL + 2):
+        baseline = controller._is_baseline_load(0, page)
+        schedule.append(baseline)
+        record_load(controller, baseline)
+
+    assert [i for i, baseline in enumerate(schedule) if baseline] == [1, BASELINE_LOAD_INTERVAL + 1]
+
+
+def test_baseline_load_skips_blocklist_and_feeds_estimate(controller):
+    record_load(controller, baseline=False)
+    assert controller.driver.blocked_urls == ["*intercom*"]
+
+    controller.driver.load_time_ms = 300
+    record_load(controller, baseline=True)
+    assert controller.driver.blocked_urls == []
+
+    controller.driver.load_time_ms = 100
+    record_load(controller, baseline=False)
+
+    stats = controller.get_network_stats()[0]
+    assert stats.loads == 2
+    assert stats.blocked_requests == 2
+    assert stats.bytes_saved_estimate == 400  # Only known after the baseline load
+    assert stats.baseline_loads == 1
+    assert stats.average_baseline_load_time_ms == 300
+    assert stats.average_load_time_ms == 100
+
+
+def test_pages_without_blocking_rules_have_no_baseline(controller):
+    controller.config.blocked_urls = []
+    page = controller.config.pages[0]
+    for _ in range(3):
+        assert controller._is_baseline_load(0, page) is False
+        record_load(controller, baseline=False)
+
+
+def set_now(monkeypatch, value):
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return value
+
+    monkeypatch.setattr(main, "datetime", FixedDatetime)
+
+
+def idle_at(controller, monkeypatch, value):
+    set_now(monkeypatch, value)
+    return controller._should_be_idle()
+
+
+# 2026-10-19 is a Monday
+@pytest.mark.parametrize("now, idle", [
+    (datetime(2026, 10, 19, 18, 59), False),
+    (datetime(2026, 10, 19, 19, 0), True),
+    (datetime(2026, 10, 19, 23, 30), True),
+    (datetime(2026, 10, 20, 6, 59), True),
+    (datetime(2026, 10, 20, 7, 0), False),
+    (datetime(2026, 10, 20, 12, 0), False),
+])
+def test_overnight_schedule(controller, monkeypatch, now, idle):
+    controller.config.idle_schedule = IdleSchedule(start="19:00", end="07:00")
+    assert idle_at(controller, monkeypatch, now) is idle
+
+
+@pytest.mark.parametrize("now, idle", [
+    (datetime(2026, 10, 19, 11, 59), False),
+    (datetime(2026, 10, 19, 12, 0), True),
+    (datetime(2026, 10, 19, 12, 59), True),
+    (datetime(2026, 10, 19, 13, 0), False),
+])
+def test_same_day_schedule(controller, monkeypatch, now, idle):
+    controller.config.idle_schedule = IdleSchedule(start="12:00", end="13:00")
+    assert idle_at(controller, monkeypatch, now) is idle
+
+
+def test_weekends(controller, monkeypatch):
+    controller.config.idle_schedule = IdleSchedule(start="19:00", end="07:00", weekends=True)
+    assert idle_at(controller, monkeypatch, datetime(2026, 10, 24, 12, 0)) is True  # Saturday
+    assert idle_at(controller, monkeypatch, datetime(2026, 10, 25, 12, 0)) is True  # Sunday
+    assert idle_at(controller, monkeypatch, datetime(2026, 10, 26, 12, 0)) is False  # Monday
+
+    controller.config.idle_schedule.weekends = False
+    assert idle_at(controller, monkeypatch, datetime(2026, 10, 24, 12, 0)) is False
+
+
+def test_manual_override_holds_until_next_boundary(controller, monkeypatch):
+    controller.config.idle_schedule = IdleSchedule(start="19:00", end="07:00")
+
+    controller.set_idle(True)  # Paused before the first schedule check
+    assert idle_at(controller, monkeypatch, datetime(2026, 10, 19, 12, 0)) is True
+    assert idle_at(controller, monkeypatch, datetime(2026, 10, 19, 18, 0)) is True
+    # 19:00 is idle anyway; the boundary drops the pause
+    assert idle_at(controller, monkeypatch, datetime(2026, 10, 19, 19, 0)) is True
+    assert controller.idle_override is None
+
+    controller.set_idle(False)  # Resumed overnight
+    assert idle_at(controller, monkeypatch, datetime(2026, 10, 19, 22, 0)) is False
+    assert idle_at(controller, monkeypatch, datetime(2026, 10, 20, 6, 59)) is False
+    # 07:00 ends the override again, and the schedule says active
+    assert idle_at(controller, monkeypatch, datetime(2026, 10, 20, 7, 0)) is False
+    assert controller.idle_override is None
+    assert idle_at(controller, monkeypatch, datetime(2026, 10, 20, 19, 0)) is True
+
+
+def test_pause_mid_page_resumes_at_same_page(controller, monkeypatch):
+    monkeypatch.setattr(main.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(main, "IDLE_CHECK_SECONDS", 0)
+    controller.config.pages.append(PageConfig(url="https://ops.example.com", duration_seconds=0))
+    controller.main_window_handle = "main"
+    controller.is_running = True
+    controller.current_page_index = 1
+    page_url = controller.config.pages[1].url
+
+    # Pause arrives while the page is on screen and interrupts the display wait
+    controller.status_callback = lambda status: controller.set_idle(True)
+    controller.run_cycle()
+    assert controller.current_page_index == 1
+    assert controller.driver.visited == [page_url]
+
+    controller.status_callback = None
+    controller.run_cycle()
+    assert controller.is_idle
+    assert controller.driver.visited[-1] == IDLE_PAGE_URL
+
+    controller.set_idle(False)
+    controller._wake_event.clear()  # Consumed by the idle wait in the real loop
+    controller.run_cycle()
+    assert not controller.is_idle
+    # Resumed at the same page, loaded once, and the rotation moved on from there
+    assert controller.driver.visited == [page_url, IDLE_PAGE_URL, page_url]
+    stats = controller.get_network_stats()[-1]
+    assert stats.loads + stats.baseline_loads == 2
+    assert controller.current_page_index == 0
+
+
+def test_failed_start_leaves_no_profile_stats(controller, tmp_path, monkeypatch):
+    def fail_to_start(options):
+        raise WebDriverException("chrome not reachable")
+
+    manager = ConfigManager(
+        config_file=os.path.join(tmp_path, "dashboard_config.json"),
+        db_file=os.path.join(tmp_path, "dashboard_config.db")
+    )
+    profile = ChromeProfile(root=str(tmp_path))
+
+    def open_profile():
+        profile.acquire()
+        return profile
+
+    monkeypatch.setattr(main, "config_manager", manager)
+    monkeypatch.setattr(main, "open_profile", open_profile)
+    monkeypatch.setattr(main.webdriver, "Chrome", fail_to_start)
+    controller.driver = None
+
+    assert controller.start_dashboard() is False
+    assert controller.get_profile_stats() is None
+    profile.acquire()  # The failed start let go of the lock
+    profile.release()
+
+
+def test_warm_up_stops_with_the_dashboard(controller):
+    controller.config.pages.append(PageConfig(url="https://ops.example.com", duration_seconds=30))
+    controller.profile_stats = ProfileStats(
+        display_name="default", profile_dir="chrome_profiles/default",
+        reused=False, cache_size_bytes=0, removed_bytes=0
+    )
+    controller.is_running = True
+
+    def stop_after_first_page(url):
+        controller.driver.visited.append(url)
+        controller.is_running = False
+
+    controller.driver.get = stop_after_first_page
+    controller._warm_up_profile()
+    assert controller.driver.visited == ["https://sales.example.com"]
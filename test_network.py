@@ -0,0 +1,60 @@
+import re
+
+from network import IMAGE_URL_PATTERNS, ResourceSizeCache, summarize_network_events
+
+
+def event(method, **params):
+    return {"method": method, "params": params}
+
+
+def blocked_by_images(url):
+    # Network.setBlockedURLs treats only "*" as a wildcard; "?" is literal
+    return any(
+        re.fullmatch(re.escape(pattern).replace(r"\*", ".*"), url)
+        for pattern in IMAGE_URL_PATTERNS
+    )
+
+
+def test_summarize_counts_blocked_and_transferred():
+    events = [
+        event("Network.requestWillBeSent", requestId="1", request={"url": "https://cdn.example.com/app.js"}),
+        event("Network.loadingFinished", requestId="1", encodedDataLength=1200),
+        event("Network.requestWillBeSent", requestId="2", request={"url": "https://tracker.example.com/t.js"}),
+        event("Network.loadingFailed", requestId="2", blockedReason="inspector"),
+    ]
+
+    blocked, transferred, sizes = summarize_network_events(events)
+
+    assert blocked == ["https://tracker.example.com/t.js"]
+    assert transferred == 1200
+    assert sizes == {"https://cdn.example.com/app.js": 1200}
+
+
+def test_size_cache_estimates_from_earlier_loads():
+    cache = ResourceSizeCache(max_entries=2)
+    cache.record({"https://tracker.example.com/t.js?cb=1": 5000})
+    cache.record({"https://tracker.example.com/t.js?cb=2": 300})  # Revalidation, headers only
+
+    assert cache.estimate(["https://tracker.example.com/t.js?cb=3", "https://unknown.example.com/x.js"]) == 5000
+
+
+def test_size_cache_is_bounded():
+    cache = ResourceSizeCache(max_entries=2)
+    cache.record({"https://a.example.com/1": 1, "https://a.example.com/2": 2, "https://a.example.com/3": 3})
+
+    assert cache.estimate(["https://a.example.com/1"]) == 0
+    assert cache.estimate(["https://a.example.com/2", "https://a.example.com/3"]) == 5
+
+
+def test_image_patterns_match_query_strings():
+    for url in ("https://cdn.example.com/logo.png", "https://cdn.example.com/logo.png?v=3"):
+        assert blocked_by_images(url)
+
+
+def test_image_patterns_leave_other_resources_alone():
+    for url in (
+        "https://cdn.example.com/iconify.min.js",
+        "https://static.gifts.example.com/app.js",
+        "https://cdn.example.com/pngjs/index.js",
+    ):
+        assert not blocked_by_images(url)
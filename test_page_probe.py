@@ -0,0 +1,134 @@
+import http.server
+import socket
+import threading
+
+import pytest
+
+from page_probe import ContentProbe
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    """Answers HEAD requests with whatever validators the test sets on the server"""
+
+    def do_HEAD(self):
+        etag = self.server.etag
+        last_modified = self.server.last_modified
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        if not etag and last_modified and self.headers.get("If-Modified-Since") == last_modified:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        if etag:
+            self.send_header("ETag", etag)
+        if last_modified:
+            self.send_header("Last-Modified", last_modified)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = http.server.HTTPServer(("127.0.0.1", 0), StandInHandler)
+    httpd.etag = None
+    httpd.last_modified = None
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def url_of(httpd):
+    return f"http://127.0.0.1:{httpd.server_port}/"
+
+
+def test_etag_unchanged_then_changed(server):
+    server.etag = '"v1"'
+    probe = ContentProbe(timeout=2)
+    url = url_of(server)
+
+    assert probe.has_changed(url) is True  # First sight
+    assert probe.has_changed(url) is False  # 304
+
+    server.etag = '"v2"'
+    assert probe.has_changed(url) is True
+    assert probe.has_changed(url) is False
+
+
+def test_last_modified_only(server):
+    server.last_modified = "Mon, 19 Oct 2026 08:00:00 GMT"
+    probe = ContentProbe(timeout=2)
+    url = url_of(server)
+
+    assert probe.has_changed(url) is True
+    assert probe.has_changed(url) is False
+
+    server.last_modified = "Mon, 19 Oct 2026 09:00:00 GMT"
+    assert probe.has_changed(url) is True
+
+
+def test_background_probe(server):
+    server.etag = '"v1"'
+    probe = ContentProbe(timeout=2)
+    url = url_of(server)
+    probe.has_changed(url)
+
+    probe.submit(url)
+    assert probe.result(url) is False
+
+
+def test_no_validators_counts_as_changed(server):
+    probe = ContentProbe(timeout=2)
+    url = url_of(server)
+
+    assert probe.has_changed(url) is True
+    assert probe.has_changed(url) is True
+
+
+def test_unreachable_host_counts_as_changed():
+    httpd = http.server.HTTPServer(("127.0.0.1", 0), StandInHandler)
+    url = url_of(httpd)
+    httpd.server_close()  # Nothing listens on this port any more
+
+    assert ContentProbe(timeout=2).has_changed(url) is True
+
+
+def test_url_without_scheme_counts_as_changed():
+    assert ContentProbe(timeout=2).result("not-a-url") is True
+
+
+def test_malformed_response_counts_as_changed():
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+
+    def answer_garbage():
+        conn, _ = listener.accept()
+        conn.recv(1024)
+        conn.sendall(b"garbage\r\n\r\n")
+        conn.close()
+
+    threading.Thread(target=answer_garbage, daemon=True).start()
+    url = f"http://127.0.0.1:{listener.getsockname()[1]}/"
+    try:
+        assert ContentProbe(timeout=2).result(url) is True
+    finally:
+        listener.close()
+
+
+def test_probe_waits_for_priming(server):
+    server.etag = '"v1"'
+    probe = ContentProbe(timeout=2)
+    url = url_of(server)
+
+    # Same URL primed and probed back to back, as in a one-page rotation
+    probe.prime(url)
+    probe.submit(url)
+    assert probe.result(url) is False
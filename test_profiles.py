@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from profiles import ChromeProfile, ProfileLockedError
+
+
+def write_file(path: str, size: int, mtime: float):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+    os.utime(path, (mtime, mtime))
+
+
+def test_profile_lock_is_exclusive(tmp_path):
+    first = ChromeProfile("wall", root=str(tmp_path))
+    first.acquire()
+    with pytest.raises(ProfileLockedError):
+        ChromeProfile("wall", root=str(tmp_path)).acquire()
+
+    first.release()
+    second = ChromeProfile("wall", root=str(tmp_path))
+    second.acquire()
+    second.release()
+
+
+def test_cleanup_removes_whole_directories_oldest_first(tmp_path):
+    profile = ChromeProfile("wall", root=str(tmp_path), other_cache_limit_mb=1)
+    mb = 1024 * 1024
+    write_file(os.path.join(profile.path, "Default", "Cache", "Cache_Data", "index"), 2 * mb, 1)
+    write_file(os.path.join(profile.path, "Default", "GPUCache", "data_0"), mb, 2)
+    write_file(os.path.join(profile.path, "Default", "Code Cache", "js", "index"), mb, 3)
+
+    assert profile.cleanup() == mb
+
+    assert not os.path.exists(os.path.join(profile.path, "Default", "GPUCache"))
+    assert os.path.exists(os.path.join(profile.path, "Default", "Code Cache", "js", "index"))
+    # The HTTP cache is capped by Chrome itself and never touched
+    assert os.path.exists(os.path.join(profile.path, "Default", "Cache", "Cache_Data", "index"))
+    assert profile.cache_size() == 3 * mb
@@ -0,0 +1,39 @@
+from tracing import Tracer
+
+
+def test_zero_sample_rate_records_nothing():
+    tracer = Tracer(sample_rate=0)
+    with tracer.trace("request") as current:
+        with tracer.span("child") as span:
+            assert current is None
+            assert span is None
+
+    assert tracer.recent() == []
+
+
+def test_spans_nest_under_root():
+    tracer = Tracer(sample_rate=1.0)
+    with tracer.trace("rotation_cycle", page_index=0):
+        with tracer.span("navigate"):
+            with tracer.span("inner"):
+                pass
+        with tracer.span("display"):
+            pass
+
+    trace = tracer.recent()[0]
+    spans = {span["name"]: span for span in trace["spans"]}
+    assert trace["name"] == "rotation_cycle"
+    assert trace["attributes"] == {"page_index": 0}
+    assert spans["navigate"]["parent_id"] == trace["span_id"]
+    assert spans["display"]["parent_id"] == trace["span_id"]
+    assert spans["inner"]["parent_id"] == spans["navigate"]["span_id"]
+
+
+def test_ring_buffer_keeps_newest_first():
+    tracer = Tracer(capacity=2, sample_rate=1.0)
+    for name in ("a", "b", "c"):
+        with tracer.trace(name):
+            pass
+
+    assert [trace["name"] for trace in tracer.recent()] == ["c", "b"]
+    assert [trace["name"] for trace in tracer.recent(1)] == ["c"]
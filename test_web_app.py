@@ -0,0 +1,41 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+import web_app
+from config import ConfigManager
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    manager = ConfigManager(
+        config_file=os.path.join(tmp_path, "dashboard_config.json"),
+        db_file=os.path.join(tmp_path, "dashboard_config.db")
+    )
+    monkeypatch.setattr(web_app, "config_manager", manager)
+    client = TestClient(web_app.app)
+    token = client.post("/api/login", json={"username": "admin", "password": "admin123"}).json()["access_token"]
+    client.headers["Authorization"] = f"Bearer {token}"
+    return client
+
+
+def test_export_then_import_round_trip(client):
+    exported = client.get("/api/playlists/default/export")
+    assert exported.status_code == 200
+    assert 'filename="default.json"' in exported.headers["content-disposition"]
+
+    imported = client.post("/api/playlists/lobby/import", json=exported.json())
+    assert imported.status_code == 200
+    assert imported.json()["revision"] == 1
+    assert client.get("/api/playlists/lobby").json() == exported.json()
+
+
+def test_export_missing_playlist(client):
+    assert client.get("/api/playlists/nope/export").status_code == 404
+
+
+def test_import_rejects_invalid_config(client):
+    response = client.post("/api/playlists/lobby/import", json={"pages": [{"url": "https://example.com"}]})
+    assert response.status_code == 422
+    assert "lobby" not in [p["name"] for p in client.get("/api/playlists").json()]
@@ -0,0 +1,154 @@
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Number of finished traces kept for /api/debug/traces
+TRACE_BUFFER_SIZE = 200
+# Fraction of requests/cycles that get traced - lower this in production (e.g. 0.05)
+TRACE_SAMPLE_RATE = 1.0
+
+
+class Span:
+    def __init__(self, name: str, parent: Optional["Span"] = None, **attributes: Any):
+        self.span_id = uuid.uuid4().hex[:16]
+        self.name = name
+        self.parent_id = parent.span_id if parent else None
+        self.attributes: Dict[str, Any] = dict(attributes)
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end is None:
+            return None
+        return round((self.end - self.start) * 1000, 3)
+
+
+class Trace:
+    def __init__(self, name: str, **attributes: Any):
+        self.trace_id = uuid.uuid4().hex
+        self.started_at = datetime.now()
+        self.thread = threading.current_thread().name
+        self.root = Span(name, **attributes)
+        self.spans: List[Span] = [self.root]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.root.span_id,
+            "name": self.root.name,
+            "started_at": self.started_at.isoformat(),
+            "thread": self.thread,
+            "duration_ms": self.root.duration_ms,
+            "attributes": self.root.attributes,
+            "spans": [
+                {
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "name": span.name,
+                    "offset_ms": round((span.start - self.root.start) * 1000, 3),
+                    "duration_ms": span.duration_ms,
+                    "attributes": span.attributes,
+                }
+                for span in self.spans[1:]
+            ],
+        }
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Span-based tracer keeping the most recent traces in a ring buffer"""
+
+    def __init__(self, capacity: int = TRACE_BUFFER_SIZE, sample_rate: float = TRACE_SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self._traces: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def trace(self, name: str, **attributes: Any):
+        """Start a new trace; yields None when this one is not sampled"""
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            trace_token = _current_trace.set(None)
+            try:
+                yield None
+            finally:
+                _current_trace.reset(trace_token)
+            return
+
+        current = Trace(name, **attributes)
+        trace_token = _current_trace.set(current)
+        span_token = _current_span.set(current.root)
+        try:
+            yield current
+        except BaseException as e:
+            current.root.attributes["error"] = type(e).__name__
+            raise
+        finally:
+            current.root.end = time.perf_counter()
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+            with self._lock:
+                self._traces.append(current)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any):
+        """Record a child span of the current trace; a no-op outside a sampled trace"""
+        current = _current_trace.get()
+        if current is None:
+            yield None
+            return
+
+        span = Span(name, parent=_current_span.get(), **attributes)
+        current.spans.append(span)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.attributes["error"] = type(e).__name__
+            raise
+        finally:
+            span.end = time.perf_counter()
+            _current_span.reset(token)
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return finished traces, newest first"""
+        with self._lock:
+            traces = list(self._traces)
+        traces.reverse()
+        if limit is not None:
+            traces = traces[:limit]
+        return [t.to_dict() for t in traces]
+
+
+class TracingMiddleware:
+    """ASGI middleware that wraps each HTTP request in a trace"""
+
+    def __init__(self, app, tracer: "Tracer"):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with self.tracer.trace(f"{scope['method']} {scope['path']}") as current:
+            async def send_wrapper(message):
+                if current is not None and message["type"] == "http.response.start":
+                    current.root.attributes["status_code"] = message["status"]
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+# Global tracer instance
+tracer = Tracer()
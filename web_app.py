@@ -1,190 +1,330 @@
-from fastapi import FastAPI, Request, HTTPException, Depends, status, Form
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-import asyncio
-import threading
-import time  # Add this import for time.sleep
-from main import dashboard_controller
-from config import config_manager
-from models import DashboardConfig, ConfigUpdateRequest, ControlRequest, StatusResponse, LoginRequest, Token, User
-from auth import authenticate_user, create_access_token, verify_token, get_user
-from datetime import timedelta
-
-
-app = FastAPI(title="Dashboard Controller", description="Web interface for dashboard management")
-
-# Setup templates
-templates = Jinja2Templates(directory="templates")
-
-# Security
-security = HTTPBearer(auto_error=False)
-
-
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
-    """Get current authenticated user"""
-    if not credentials:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    username = verify_token(credentials.credentials)
-    if username is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    user = get_user(username)
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
-
-    return user
-
-
-async def get_current_user_web(request: Request) -> User:
-    """Get current authenticated user for web pages - redirects to login if not authenticated"""
-    credentials = await security(request)
-    if not credentials:
-        # Redirect to login page for web requests
-        return RedirectResponse(url="/login", status_code=302)
-
-    username = verify_token(credentials.credentials)
-    if username is None:
-        # Redirect to login page for invalid tokens
-        return RedirectResponse(url="/login", status_code=302)
-
-    user = get_user(username)
-    if user is None:
-        # Redirect to login page for unknown users
-        return RedirectResponse(url="/login", status_code=302)
-
-    return user
-
-
-@app.get("/login", response_class=HTMLResponse)
-async def login_page(request: Request):
-    """Login page"""
-    return templates.TemplateResponse("login.html", {"request": request})
-
-
-@app.post("/api/login")
-async def login(request: LoginRequest):
-    """Login endpoint"""
-    user = authenticate_user(request.username, request.password)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect username or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    access_token_expires = timedelta(minutes=30)
-    access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
-    )
-
-    return {"access_token": access_token, "token_type": "bearer"}
-
-
-@app.get("/", response_class=HTMLResponse)
-async def dashboard_ui(request: Request):
-    """Main dashboard UI"""
-    # For initial page load, we'll let JavaScript handle authentication
-    # This allows the page to load and then check for stored tokens
-    config = config_manager.get_config()
-    status_info = dashboard_controller._get_status()
-
-    # Check if we have a valid token in the request
-    auth_header = request.headers.get("Authorization")
-    current_user = None
-
-    if auth_header and auth_header.startswith("Bearer "):
-        token = auth_header.split(" ")[1]
-        username = verify_token(token)
-        if username:
-            current_user = get_user(username)
-
-    return templates.TemplateResponse("index.html", {
-        "request": request,
-        "config": config,
-        "status": status_info,
-        "user": current_user
-    })
-
-
-@app.get("/api/status", response_model=StatusResponse)
-def get_status(current_user: User = Depends(get_current_user)):
-    """Get current dashboard status"""
-    return dashboard_controller._get_status()
-
-
-@app.get("/api/config")
-def get_config(current_user: User = Depends(get_current_user)):
-    """Get current configuration"""
-    return config_manager.get_config()
-
-
-@app.post("/api/config")
-def update_config(request: ConfigUpdateRequest, current_user: User = Depends(get_current_user)):
-    """Update dashboard configuration"""
-    try:
-        config_manager.save_config(request.config)
-        return {"message": "Configuration updated successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Failed to update config: {str(e)}")
-
-
-@app.post("/api/control")
-def control_dashboard(request: ControlRequest, current_user: User = Depends(get_current_user)):
-    """Control dashboard (start/stop/pause/resume)"""
-    action = request.action.lower()
-
-    if action == "start":
-        if dashboard_controller.start_dashboard():
-            # Start dashboard in background thread
-            thread = threading.Thread(target=run_dashboard_loop, daemon=True)
-            thread.start()
-            return {"message": "Dashboard started"}
-        else:
-            raise HTTPException(status_code=500, detail="Failed to start dashboard")
-
-    elif action == "stop":
-        dashboard_controller.stop_dashboard()
-        return {"message": "Dashboard stopped"}
-
-    else:
-        raise HTTPException(status_code=400, detail=f"Unknown action: {action}")
-
-
-def run_dashboard_loop():
-    """Run dashboard cycle in a loop"""
-    while dashboard_controller.is_running:
-        dashboard_controller.run_cycle()
-        time.sleep(1)  # Small delay between cycles
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize on startup"""
-    # Load configuration
-    config_manager.load_config()
-
-    # Set up logging
-    import logging
-    logging.basicConfig(level=logging.INFO)
-
-    print("Dashboard web app started")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    dashboard_controller.stop_dashboard()
-    print("Dashboard web app stopped")
+from fastapi import FastAPI, Request, HTTPException, Depends, status, Form, Query
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from fastapi.templating import Jinja2Templates
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import asyncio
+import re
+import threading
+import time  # Add this import for time.sleep
+from main import dashboard_controller
+from config import config_manager, PlaylistNotFoundError
+from models import DashboardConfig, ConfigUpdateRequest, ControlRequest, StatusResponse, LoginRequest, Token, User, PlaylistInfo, RevisionInfo, PageNetworkStats, ProfileStats
+from typing import List
+from auth import authenticate_user, create_access_token, verify_token, get_user
+from tracing import tracer, TracingMiddleware, TRACE_BUFFER_SIZE
+from datetime import timedelta
+
+
+app = FastAPI(title="Dashboard Controller", description="Web interface for dashboard management")
+app.add_middleware(TracingMiddleware, tracer=tracer)
+
+# Setup templates
+templates = Jinja2Templates(directory="templates")
+
+# Security
+security = HTTPBearer(auto_error=False)
+
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> User:
+    """Get current authenticated user"""
+    if not credentials:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    with tracer.span("verify_token"):
+        username = verify_token(credentials.credentials)
+    if username is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    with tracer.span("get_user"):
+        user = get_user(username)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+        )
+
+    return user
+
+
+async def get_current_user_web(request: Request) -> User:
+    """Get current authenticated user for web pages - redirects to login if not authenticated"""
+    credentials = await security(request)
+    if not credentials:
+        # Redirect to login page for web requests
+        return RedirectResponse(url="/login", status_code=302)
+
+    username = verify_token(credentials.credentials)
+    if username is None:
+        # Redirect to login page for invalid tokens
+        return RedirectResponse(url="/login", status_code=302)
+
+    user = get_user(username)
+    if user is None:
+        # Redirect to login page for unknown users
+        return RedirectResponse(url="/login", status_code=302)
+
+    return user
+
+
+@app.get("/login", response_class=HTMLResponse)
+async def login_page(request: Request):
+    """Login page"""
+    return templates.TemplateResponse("login.html", {"request": request})
+
+
+@app.post("/api/login")
+async def login(request: LoginRequest):
+    """Login endpoint"""
+    user = authenticate_user(request.username, request.password)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    access_token_expires = timedelta(minutes=30)
+    access_token = create_access_token(
+        data={"sub": user.username}, expires_delta=access_token_expires
+    )
+
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@app.get("/", response_class=HTMLResponse)
+async def dashboard_ui(request: Request):
+    """Main dashboard UI"""
+    # For initial page load, we'll let JavaScript handle authentication
+    # This allows the page to load and then check for stored tokens
+    config = config_manager.get_config()
+    with tracer.span("get_status"):
+        status_info = dashboard_controller._get_status()
+
+    # Check if we have a valid token in the request
+    auth_header = request.headers.get("Authorization")
+    current_user = None
+
+    if auth_header and auth_header.startswith("Bearer "):
+        token = auth_header.split(" ")[1]
+        with tracer.span("verify_token"):
+            username = verify_token(token)
+        if username:
+            current_user = get_user(username)
+
+    with tracer.span("render_template", template="index.html"):
+        return templates.TemplateResponse("index.html", {
+            "request": request,
+            "config": config,
+            "status": status_info,
+            "user": current_user
+        })
+
+
+@app.get("/api/status", response_model=StatusResponse)
+def get_status(current_user: User = Depends(get_current_user)):
+    """Get current dashboard status"""
+    with tracer.span("get_status"):
+        return dashboard_controller._get_status()
+
+
+@app.get("/api/config")
+def get_config(current_user: User = Depends(get_current_user)):
+    """Get current configuration"""
+    return config_manager.get_config()
+
+
+@app.post("/api/config")
+def update_config(request: ConfigUpdateRequest, current_user: User = Depends(get_current_user)):
+    """Update dashboard configuration"""
+    try:
+        config_manager.save_config(request.config)
+        dashboard_controller.switch_config(request.config)
+        return {"message": "Configuration updated successfully"}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to update config: {str(e)}")
+
+
+@app.get("/api/playlists", response_model=List[PlaylistInfo])
+def list_playlists(current_user: User = Depends(get_current_user)):
+    """List all playlists"""
+    return config_manager.list_playlists()
+
+
+@app.get("/api/playlists/{name}")
+def get_playlist(name: str, current_user: User = Depends(get_current_user)):
+    """Get a playlist's configuration"""
+    try:
+        return config_manager.get_playlist(name)
+    except PlaylistNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@app.post("/api/playlists/{name}")
+def save_playlist(name: str, request: ConfigUpdateRequest, current_user: User = Depends(get_current_user)):
+    """Create or update a playlist"""
+    try:
+        revision = config_manager.save_playlist(name, request.config)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to save playlist: {str(e)}")
+    if name == config_manager.active_playlist:
+        dashboard_controller.switch_config(request.config)
+    return {"message": f"Playlist '{name}' saved", "revision": revision}
+
+
+@app.post("/api/playlists/{name}/activate")
+def activate_playlist(name: str, current_user: User = Depends(get_current_user)):
+    """Switch to another playlist"""
+    try:
+        config = config_manager.activate_playlist(name)
+    except PlaylistNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    dashboard_controller.switch_config(config)
+    return {"message": f"Playlist '{name}' activated"}
+
+
+@app.delete("/api/playlists/{name}")
+def delete_playlist(name: str, current_user: User = Depends(get_current_user)):
+    """Delete a playlist"""
+    try:
+        config_manager.delete_playlist(name)
+    except PlaylistNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"message": f"Playlist '{name}' deleted"}
+
+
+@app.get("/api/playlists/{name}/export")
+def export_playlist(name: str, current_user: User = Depends(get_current_user)):
+    """Download a playlist as a JSON config file"""
+    try:
+        config = config_manager.get_playlist(name)
+    except PlaylistNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    filename = re.sub(r"[^\w.-]", "_", name) + ".json"
+    return JSONResponse(
+        content=config.model_dump(mode="json"),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@app.post("/api/playlists/{name}/import")
+def import_playlist(name: str, config: DashboardConfig, current_user: User = Depends(get_current_user)):
+    """Create or update a playlist from an exported JSON config file"""
+    try:
+        revision = config_manager.save_playlist(name, config)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to import playlist: {str(e)}")
+    if name == config_manager.active_playlist:
+        dashboard_controller.switch_config(config)
+    return {"message": f"Playlist '{name}' imported", "revision": revision}
+
+
+@app.get("/api/playlists/{name}/revisions", response_model=List[RevisionInfo])
+def list_revisions(name: str, current_user: User = Depends(get_current_user)):
+    """List a playlist's revision history"""
+    try:
+        return config_manager.list_revisions(name)
+    except PlaylistNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@app.post("/api/playlists/{name}/revisions/{revision}/restore")
+def restore_revision(name: str, revision: int, current_user: User = Depends(get_current_user)):
+    """Restore an old revision of a playlist"""
+    try:
+        new_revision = config_manager.restore_revision(name, revision)
+    except PlaylistNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    if name == config_manager.active_playlist:
+        dashboard_controller.switch_config(config_manager.get_config())
+    return {"message": f"Playlist '{name}' restored to revision {revision}", "revision": new_revision}
+
+
+@app.post("/api/control")
+def control_dashboard(request: ControlRequest, current_user: User = Depends(get_current_user)):
+    """Control dashboard (start/stop/pause/resume)"""
+    action = request.action.lower()
+
+    if action == "start":
+        if dashboard_controller.is_running:
+            raise HTTPException(status_code=400, detail="Dashboard is already running")
+        if dashboard_controller.start_dashboard():
+            # Start dashboard in background thread
+            thread = threading.Thread(target=run_dashboard_loop, daemon=True)
+            thread.start()
+            return {"message": "Dashboard started"}
+        else:
+            raise HTTPException(status_code=500, detail="Failed to start dashboard")
+
+    elif action == "stop":
+        dashboard_controller.stop_dashboard()
+        return {"message": "Dashboard stopped"}
+
+    elif action in ("pause", "resume"):
+        if not dashboard_controller.is_running:
+            raise HTTPException(status_code=400, detail="Dashboard is not running")
+        dashboard_controller.set_idle(action == "pause")
+        return {"message": "Dashboard entering idle mode" if action == "pause" else "Dashboard resuming"}
+
+    else:
+        raise HTTPException(status_code=400, detail=f"Unknown action: {action}")
+
+
+@app.get("/api/network-stats", response_model=List[PageNetworkStats])
+def get_network_stats(current_user: User = Depends(get_current_user)):
+    """Get per-page blocked request counts, bytes saved and load times"""
+    return dashboard_controller.get_network_stats()
+
+
+@app.get("/api/profile", response_model=ProfileStats)
+def get_profile_stats(current_user: User = Depends(get_current_user)):
+    """Get the Chrome profile state and cold/warm load times"""
+    profile_stats = dashboard_controller.get_profile_stats()
+    if profile_stats is None:
+        raise HTTPException(status_code=404, detail="No persistent Chrome profile in use")
+    return profile_stats
+
+
+@app.get("/api/debug/traces")
+def get_traces(limit: int = Query(50, ge=1, le=TRACE_BUFFER_SIZE), current_user: User = Depends(get_current_user)):
+    """Get the most recent request and rotation-cycle traces"""
+    return {
+        "sample_rate": tracer.sample_rate,
+        "traces": tracer.recent(limit)
+    }
+
+
+def run_dashboard_loop():
+    """Run dashboard cycle in a loop"""
+    while dashboard_controller.is_running:
+        dashboard_controller.run_cycle()
+        time.sleep(1)  # Small delay between cycles
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Initialize on startup"""
+    # Load configuration
+    config_manager.load_config()
+
+    # Set up logging
+    import logging
+    logging.basicConfig(level=logging.INFO)
+
+    print("Dashboard web app started")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Cleanup on shutdown"""
+    dashboard_controller.stop_dashboard()
+    print("Dashboard web app stopped")